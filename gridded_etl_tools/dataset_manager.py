@@ -213,9 +213,10 @@ class DatasetManager(Logging, Publish, ABC, IPFS):
         # RAM, adjust in the init of your manager if you desire a diffeerent ratio. If there are not enough cores
         # available to use the target number of threads, use the number of available cores.
         total_memory_gb = psutil.virtual_memory().total / 1_000_000_000
+        cpu_count = multiprocessing.cpu_count()
         target_thread_count = int(dask_cpu_mem_target_ratio * total_memory_gb)
-        if target_thread_count >= multiprocessing.cpu_count():
-            target_thread_count = multiprocessing.cpu_count() - 1
+        if target_thread_count >= cpu_count:
+            target_thread_count = cpu_count - 1
 
         if target_thread_count < 1:
             target_thread_count = 1
@@ -223,8 +224,7 @@ class DatasetManager(Logging, Publish, ABC, IPFS):
         self.dask_num_threads = target_thread_count
 
         self.info(
-            f"Using {self.dask_num_threads} threads on a {multiprocessing.cpu_count()}-core system with "
-            f"{total_memory_gb:.2f}GB RAM"
+            f"Using {self.dask_num_threads} threads on a {cpu_count}-core system with {total_memory_gb:.2f}GB RAM"
         )
 
         self.encryption_key = register_encryption_key(encryption_key) if encryption_key else None
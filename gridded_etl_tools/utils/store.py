@@ -9,7 +9,6 @@ if TYPE_CHECKING:  # pragma NO COVER
 import datetime
 import json
 
-import shutil
 import s3fs
 import xarray as xr
 import ipldstore
@@ -620,24 +619,23 @@ class Local(StoreInterface):
             Path part corresponding to type of STAC entity
             (empty string for Catalog, 'collections' for Collection or 'datasets' for Item)
         """
-        metadata_path = pathlib.Path(self.get_metadata_path(title, stac_type))
-        if metadata_path.exists():
+        # fsspec's `copy` can't take `pathlib.Path` arguments, so every path passed to the filesystem is a `str`
+        metadata_path = str(self.get_metadata_path(title, stac_type))
+        fs = self.fs()
+        if fs.exists(metadata_path):
             # Generate history file
-            old_mod_time = (
-                datetime.datetime.fromtimestamp(metadata_path.stat().st_mtime)
-                .astimezone(datetime.timezone.utc)
-                .replace(tzinfo=None)
-            )
+            old_mod_time = datetime.datetime.fromtimestamp(
+                fs.info(metadata_path)["mtime"], tz=datetime.timezone.utc
+            ).replace(tzinfo=None)
             history_path = (
                 pathlib.Path(self.folder) / "history" / title / f"{title}-{old_mod_time.isoformat(sep='T')}.json"
             )
-            history_path.parent.mkdir(exist_ok=True, parents=True)
-            shutil.copy(metadata_path, history_path)
+            fs.makedirs(str(history_path.parent), exist_ok=True)
+            fs.copy(metadata_path, str(history_path))
 
         # Write new metadata to file (may overwrite)
-        metadata_path.parent.mkdir(exist_ok=True, parents=True)
-        with open(metadata_path, "w") as f:
-            json.dump(stac_content, f)
+        fs.makedirs(str(pathlib.Path(metadata_path).parent), exist_ok=True)
+        fs.write_text(metadata_path, json.dumps(stac_content))
 
     def retrieve_metadata(self, title: str, stac_type: str) -> tuple[dict, str]:
         """
@@ -701,9 +699,11 @@ class Local(StoreInterface):
 
     def write_metadata_only(self, update_attrs: dict[str, Any]):
         # Edit both .zmetadata and .zattrs
+        fs = self.fs()
+
         for z_path in (".zmetadata", ".zattrs"):
             # Read current metadata from Zarr
-            with open(self.path / z_path) as z_contents:
+            with fs.open(f"{self.path}/{z_path}") as z_contents:
                 current_attributes = json.load(z_contents)
 
             # Update given attributes at the appropriate location depending on which z file
@@ -713,5 +713,5 @@ class Local(StoreInterface):
                 current_attributes.update(update_attrs)
 
             # Write back to Zarr
-            with open(self.path / z_path, "w") as z_contents:
+            with fs.open(f"{self.path}/{z_path}", "w") as z_contents:
                 json.dump(current_attributes, z_contents)
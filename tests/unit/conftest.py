@@ -1,3 +1,4 @@
+import copy
 import datetime
 import json
 import pathlib
@@ -13,14 +14,31 @@ INPUTS = HERE / "inputs"
 
 
 @pytest.fixture
-def example_zarr_json():
+def example_zarr_json(_example_zarr_json):
+    # Kerchunk pre/post processing modifies refs in place, so each test gets its own copy
+    return copy.deepcopy(_example_zarr_json)
+
+
+@pytest.fixture(scope="session")
+def _example_zarr_json():
     example_json = INPUTS / "chirps_example_zarr.json"
-    zarr_json = json.loads(open(example_json).read())
-    return zarr_json
+    with open(example_json) as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="session")
+def example_orig_fill_value(_example_zarr_json):
+    return json.loads(_example_zarr_json["refs"]["latitude/.zarray"])["fill_value"]
 
 
 @pytest.fixture
-def fake_original_dataset():
+def fake_original_dataset(_fake_original_dataset):
+    # Tests are free to modify the dataset they're given, so each gets its own copy of the session's dataset
+    return _fake_original_dataset.copy(deep=True)
+
+
+@pytest.fixture(scope="session")
+def _fake_original_dataset():
     time = xr.DataArray(np.array(original_times), dims="time", coords={"time": np.arange(138)})
     latitude = xr.DataArray(np.arange(10, 50, 10), dims="latitude", coords={"latitude": np.arange(10, 50, 10)})
     longitude = xr.DataArray(np.arange(100, 140, 10), dims="longitude", coords={"longitude": np.arange(100, 140, 10)})
@@ -101,7 +119,12 @@ def hindcast_dataset():
 
 
 @pytest.fixture
-def fake_complex_update_dataset():
+def fake_complex_update_dataset(_fake_complex_update_dataset):
+    return _fake_complex_update_dataset.copy(deep=True)
+
+
+@pytest.fixture(scope="session")
+def _fake_complex_update_dataset():
     time = xr.DataArray(np.array(complex_update_times), dims="time", coords={"time": np.arange(60)})
     latitude = xr.DataArray(np.arange(10, 50, 10), dims="latitude", coords={"latitude": np.arange(10, 50, 10)})
     longitude = xr.DataArray(np.arange(100, 140, 10), dims="longitude", coords={"longitude": np.arange(100, 140, 10)})
@@ -142,6 +165,12 @@ def manager_class():
     return DummyManager
 
 
+@pytest.fixture(scope="module")
+def base_manager():
+    """A manager shared across a test module, for tests that don't change its state (or only patch it)"""
+    return DummyManager()
+
+
 def unimplemented(*args, **kwargs):  # pragma NO COVER
     raise NotImplementedError
 
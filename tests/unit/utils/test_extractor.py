@@ -1,5 +1,4 @@
 import pytest
-import time
 import ftplib
 import pathlib
 import responses
@@ -284,7 +283,7 @@ class TestS3Extractor:
         extractor.dm.kerchunkify.assert_not_called()
 
     @staticmethod
-    def test_s3_request_fail(manager_class):
+    def test_s3_request_fail(manager_class, mocker):
         extract = S3Extractor(manager_class())
 
         rfp = "s3://bucket/sand/castle/castle1.grib"
@@ -292,18 +291,22 @@ class TestS3Extractor:
         args = [rfp, 0, 5, lfp, None]
 
         extract.dm.kerchunkify = Mock(side_effect=Exception("mocked error"))
-        time.sleep = Mock()  # avoid actually sleeping for large period of time
+        sleep = mocker.patch("gridded_etl_tools.utils.extractor.time.sleep")  # avoid actually sleeping
 
         with pytest.raises(FileNotFoundError):
             extract.request(*args)
-        assert time.sleep.call_count == 5
+        assert sleep.call_count == 5
+
+
+@pytest.fixture
+def ftp_client(mocker):
+    return mocker.patch("gridded_etl_tools.utils.extractor.ftplib.FTP", DummyFtpClient())
 
 
 class TestFTPExtractor:
     @staticmethod
-    def test_context_manager():
+    def test_context_manager(ftp_client):
         dm = Mock()
-        ftp_client = ftplib.FTP = DummyFtpClient()
         ftp_client.close = Mock()
         host = "what a great host"
 
@@ -315,9 +318,8 @@ class TestFTPExtractor:
         ftp_client.close.assert_called_once()
 
     @staticmethod
-    def test_context_manager_no_host():
+    def test_context_manager_no_host(ftp_client):
         dm = Mock()
-        ftp_client = ftplib.FTP = DummyFtpClient()
         ftp_client.close = Mock()
 
         with pytest.raises(TypeError):
@@ -329,7 +331,7 @@ class TestFTPExtractor:
         ftp_client.close.assert_not_called()
 
     @staticmethod
-    def test_batch_requests():
+    def test_batch_requests(ftp_client):
         dm = Mock()
         host = "what a great host"
 
@@ -342,9 +344,8 @@ class TestFTPExtractor:
         assert found_files == expected_files
 
     @staticmethod
-    def test_cwd():
+    def test_cwd(ftp_client):
         dm = Mock()
-        ftp_client = ftplib.FTP = DummyFtpClient()
         ftp_client.pwd = Mock(return_value="")
 
         host = "what a great host"
@@ -357,9 +358,8 @@ class TestFTPExtractor:
         ftp_client.cwd.assert_called_once_with("over there")
 
     @staticmethod
-    def test_cwd_setter_no_such_path():
+    def test_cwd_setter_no_such_path(ftp_client):
         dm = Mock()
-        ftp_client = ftplib.FTP = DummyFtpClient()
         ftp_client.pwd = Mock(return_value="")
         ftp_client.nlst = Mock(return_value=None)
 
@@ -374,9 +374,8 @@ class TestFTPExtractor:
         ftp_client.nlst.assert_called_once_with("over there")
 
     @staticmethod
-    def test_cwd_client_error():
+    def test_cwd_client_error(ftp_client):
         dm = Mock()
-        ftp_client = ftplib.FTP = DummyFtpClient()
         ftp_client.pwd = Mock(return_value="")
         ftp_client.cwd = Mock(side_effect=ftplib.error_perm)
 
@@ -390,13 +389,12 @@ class TestFTPExtractor:
         ftp_client.cwd.assert_called_once_with("over there")
 
     @staticmethod
-    def test_cwd_connection_not_open():
+    def test_cwd_connection_not_open(ftp_client):
         """
         Test that CWD returns errors as expected if `cwd` is called when a connection
         is closed
         """
         dm = Mock()
-        ftp_client = ftplib.FTP = DummyFtpClient()
         ftp_client.login = Mock(side_effect=ftp_client.__enter__)
         ftp_client.close = Mock(side_effect=ftp_client.__exit__)
 
@@ -411,9 +409,8 @@ class TestFTPExtractor:
         # TODO create a test for the cwd.setter
 
     @staticmethod
-    def test_request(tmp_path):
+    def test_request(ftp_client, tmp_path):
         dm = Mock()
-        ftp_client = ftplib.FTP = DummyFtpClient()
         ftp_client.retrbinary = Mock(side_effect=ftp_client.retrbinary)
 
         host = "what a great host"
@@ -428,9 +425,8 @@ class TestFTPExtractor:
         assert ftp_client.commands == ["RETR two.dat"]
 
     @staticmethod
-    def test_request_destination_is_not_a_directory(tmp_path):
+    def test_request_destination_is_not_a_directory(ftp_client, tmp_path):
         dm = Mock()
-        ftp_client = ftplib.FTP = DummyFtpClient()
         ftp_client.retrbinary = Mock(side_effect=ftp_client.retrbinary)
 
         host = "what a great host"
@@ -445,9 +441,8 @@ class TestFTPExtractor:
         assert ftp_client.commands == ["RETR two.dat"]
 
     @staticmethod
-    def test_request_client_error(tmp_path):
+    def test_request_client_error(ftp_client, tmp_path):
         dm = Mock()
-        ftp_client = ftplib.FTP = DummyFtpClient()
         ftp_client.retrbinary = Mock(side_effect=ftplib.error_perm)
 
         host = "what a great host"
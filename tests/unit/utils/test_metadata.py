@@ -135,6 +135,7 @@ class TestMetadata:
 
     @staticmethod
     def test_set_initial_compression(manager_class, fake_original_dataset):
+        """Test setting initial compression on a new dataset"""
         dm = manager_class(use_compression=True)
         dm.store = mock.Mock(spec=store.StoreInterface)
         dm.store.has_existing = False
@@ -144,10 +145,6 @@ class TestMetadata:
             dataset[coord].encoding = {}
         dataset["data"].encoding = {}
 
-        dm = manager_class(use_compression=True)
-        dm.store = mock.Mock(spec=store.StoreInterface)
-        dm.store.has_existing = False
-
         dm.set_initial_compression(dataset)
         for coord in dataset.coords:
             assert dataset[coord].encoding["compressor"] == numcodecs.Blosc()
@@ -155,24 +152,6 @@ class TestMetadata:
         assert dataset["data"].encoding["compressor"] == numcodecs.Blosc()
         assert dataset[dm.data_var].encoding["compressor"].cname == "lz4"
 
-    # @staticmethod
-    # def test_set_initial_compression(manager_class, fake_original_dataset):
-    #     """Test setting initial compression on a new dataset"""
-    #     dm = manager_class(use_compression=True)
-    #     dm.store = mock.Mock(spec=store.StoreInterface)
-    #     dm.store.has_existing = False
-
-    #     dataset = fake_original_dataset
-    #     dm.set_initial_compression(dataset)
-
-    #     # Check that compressor was set for coordinates and data variable
-    #     for coord in dataset.coords:
-    #         assert isinstance(dataset[coord].encoding["compressor"], numcodecs.Blosc)
-    #         assert dataset[coord].encoding["compressor"].cname == "lz4"
-
-    #     assert isinstance(dataset[dm.data_var].encoding["compressor"], numcodecs.Blosc)
-    #     assert dataset[dm.data_var].encoding["compressor"].cname == "lz4"
-
     @staticmethod
     def test_set_initial_compression_no_compression(manager_class, fake_original_dataset):
         """Test that `set_initial_compression` does nothing if compression is disabled"""
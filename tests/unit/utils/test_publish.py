@@ -15,6 +15,14 @@ import pytest
 from gridded_etl_tools.utils import publish, store
 from gridded_etl_tools.utils.errors import NanFrequencyMismatchError
 
+# Static inputs for the `are_times_in_expected_order` tests, built once at import
+CADENCE_START = numpy.datetime64("2000-01-01T00:00:00")
+CADENCE_DELTA = numpy.datetime64("2000-01-01T01:00:00") - CADENCE_START
+REGULAR_TIMES = CADENCE_START + numpy.arange(10) * CADENCE_DELTA
+REGULAR_TIMES_WITH_GAP = numpy.append(REGULAR_TIMES, CADENCE_START + CADENCE_DELTA * 20)
+IRREGULAR_TIMES_IN_BOUNDS = CADENCE_START + numpy.arange(10) * CADENCE_DELTA * 1.05
+IRREGULAR_TIMES_OUT_OF_BOUNDS = CADENCE_START + numpy.arange(10) * CADENCE_DELTA * 2.5
+
 
 def generate_partial_nan_array(shape: tuple[float], percent_nan: float):
     # Calculate the number of NaNs and floats
@@ -896,17 +904,14 @@ class TestPublish:
 
     @staticmethod
     def test_calculate_update_time_ranges(
-        manager_class,
+        base_manager,
         fake_original_dataset,
         fake_complex_update_dataset,
     ):
         """
         Test that the calculate_date_ranges function correctly prepares insert and append date ranges as anticipated
         """
-        # prepare a dataset manager
-        dm = manager_class()
-        dm.set_key_dims()
-        datetime_ranges, regions_indices = dm.calculate_update_time_ranges(
+        datetime_ranges, regions_indices = base_manager.calculate_update_time_ranges(
             fake_original_dataset, fake_complex_update_dataset
         )
         # Test that 7 distinct updates -- 6 inserts and 1 append -- have been prepared
@@ -1160,46 +1165,28 @@ class TestPublish:
             dm.update_quality_check(fake_original_dataset, [], [])
 
     @staticmethod
-    def test_are_times_in_expected_order_regular_cadence_ok(manager_class):
-        start = numpy.datetime64("2000-01-01T00:00:00")
-        delta = numpy.datetime64("2000-01-01T01:00:00") - start
-        times = [start + i * delta for i in range(10)]
-
-        dm = manager_class()
-        assert dm.are_times_in_expected_order(times, delta) is True
+    def test_are_times_in_expected_order_regular_cadence_ok(base_manager):
+        assert base_manager.are_times_in_expected_order(REGULAR_TIMES, CADENCE_DELTA) is True
 
     @staticmethod
-    def test_are_times_in_expected_order_regular_cadence_not_ok(manager_class):
-        start = numpy.datetime64("2000-01-01T00:00:00")
-        delta = numpy.datetime64("2000-01-01T01:00:00") - start
-        times = [start + i * delta for i in range(10)] + [start + delta * 20]
-
-        dm = manager_class()
-        assert dm.are_times_in_expected_order(times, delta) is False
+    def test_are_times_in_expected_order_regular_cadence_not_ok(base_manager):
+        assert base_manager.are_times_in_expected_order(REGULAR_TIMES_WITH_GAP, CADENCE_DELTA) is False
 
     @staticmethod
     def test_are_times_in_expected_order_irregular_cadence_ok(manager_class):
-        start = numpy.datetime64("2000-01-01T00:00:00")
-        delta = numpy.datetime64("2000-01-01T01:00:00") - start
-        times = [start + i * delta * 1.05 for i in range(10)]
-
         class MyManager(manager_class):
-            update_cadence_bounds = (delta / 2, delta * 2)
+            update_cadence_bounds = (CADENCE_DELTA / 2, CADENCE_DELTA * 2)
 
         dm = MyManager()
-        assert dm.are_times_in_expected_order(times, delta) is True
+        assert dm.are_times_in_expected_order(IRREGULAR_TIMES_IN_BOUNDS, CADENCE_DELTA) is True
 
     @staticmethod
     def test_are_times_in_expected_order_irregular_cadence_not_ok(manager_class):
-        start = numpy.datetime64("2000-01-01T00:00:00")
-        delta = numpy.datetime64("2000-01-01T01:00:00") - start
-        times = [start + i * delta * 2.5 for i in range(10)]
-
         class MyManager(manager_class):
-            update_cadence_bounds = (delta / 2, delta * 2)
+            update_cadence_bounds = (CADENCE_DELTA / 2, CADENCE_DELTA * 2)
 
         dm = MyManager()
-        assert dm.are_times_in_expected_order(times, delta) is False
+        assert dm.are_times_in_expected_order(IRREGULAR_TIMES_OUT_OF_BOUNDS, CADENCE_DELTA) is False
 
     @staticmethod
     def test_post_parse_quality_check(manager_class, mocker):
@@ -1,13 +1,100 @@
 import datetime
+import io
 import json
 import os
 import pathlib
+from types import SimpleNamespace as NS
 from unittest import mock
 
 import pytest
 
 from gridded_etl_tools.utils import store as store_module
 
+from ..conftest import noop
+
+
+# Only tests that check how a store builds its filesystem or mapper patch s3fs or fsspec, and only for that test. Other
+# tests inject a mock filesystem into the store instance under test.
+@pytest.fixture
+def s3fs_mock(mocker):
+    return mocker.patch("gridded_etl_tools.utils.store.s3fs")
+
+
+@pytest.fixture
+def fsspec_mock(mocker):
+    return mocker.patch("gridded_etl_tools.utils.store.fsspec")
+
+
+@pytest.fixture(scope="session")
+def _fs_chain():
+    fs_chain = mock.Mock()
+    return fs_chain, fs_chain.return_value
+
+
+@pytest.fixture
+def fs_chain(_fs_chain):
+    """A mock to stand in for `store.fs`, reused across tests and reset to a blank state for each one"""
+    fs_chain, fs = _fs_chain
+    fs_chain.reset_mock(return_value=True, side_effect=True)
+    fs.reset_mock(return_value=True, side_effect=True)
+    fs_chain.return_value = fs  # some tests replace the filesystem with a FakeFS
+    return fs_chain
+
+
+class FakeFS(dict):
+    """
+    An in-memory stand-in for the parts of an fsspec filesystem the stores use, holding the text contents of each file
+    by path. Directories aren't tracked, and every file reports the same modification time. Like fsspec's `copy`,
+    it only accepts `str` paths.
+    """
+
+    mtime = 1692639017
+
+    @staticmethod
+    def _check(*paths):
+        assert all(isinstance(path, str) for path in paths), f"fsspec paths must be str, got {paths!r}"
+
+    def open(self, path, mode="rb"):
+        self._check(path)
+        if "w" in mode:
+            return FakeFile(self, path)
+        return io.StringIO(self[path])
+
+    def exists(self, path):
+        self._check(path)
+        return path in self
+
+    def info(self, path):
+        self._check(path)
+        return {"name": path, "mtime": self.mtime}
+
+    def makedirs(self, path, exist_ok=False):
+        """Directories are implied by the file paths"""
+        self._check(path)
+
+    def copy(self, path1, path2):
+        self._check(path1, path2)
+        self[path2] = self[path1]
+
+    def write_text(self, path, value):
+        self._check(path)
+        self[path] = value
+
+
+class FakeFile(io.StringIO):
+    """
+    A writable file for `FakeFS`, which saves its contents to the filesystem when used as a context manager
+    """
+
+    def __init__(self, fs: FakeFS, path: str):
+        super().__init__()
+        self.fs = fs
+        self.path = path
+
+    def __exit__(self, *exc_args):
+        self.fs[self.path] = self.getvalue()
+        return super().__exit__(*exc_args)
+
 
 class DummyStoreImpl(store_module.StoreInterface):
     has_existing = True
@@ -66,6 +153,18 @@ class TestStoreInterface:
         store._mapper.assert_not_called()
 
 
+@pytest.fixture
+def s3_store():
+    # `S3.fs` logs through the dataset manager, so it needs an `info` method
+    return store_module.S3(NS(custom_output_path="put/it/here.zarr", info=noop), "bucket")
+
+
+@pytest.fixture
+def s3_store_with_fs(s3_store, fs_chain):
+    s3_store.fs = fs_chain
+    return s3_store
+
+
 class TestS3:
     @staticmethod
     def test_constructor():
@@ -85,121 +184,75 @@ class TestS3:
             store_module.S3(dm, "")
 
     @staticmethod
-    def test_fs(mocker):
-        s3fs = mocker.patch("gridded_etl_tools.utils.store.s3fs")
-        store = store_module.S3(mock.Mock(), "bucket")
-        fs = s3fs.S3FileSystem.return_value
-
-        assert store.fs() is fs
-        assert store.fs() is fs  # second call returns cached value
-
-        s3fs.S3FileSystem.assert_called_once_with(profile=None)
-
-    @staticmethod
-    def test_fs_refresh(mocker):
-        s3fs = mocker.patch("gridded_etl_tools.utils.store.s3fs")
-        store = store_module.S3(mock.Mock(), "bucket")
-        store._fs = object()
-        fs = s3fs.S3FileSystem.return_value
-
-        assert store.fs(refresh=True) is fs
-
-        s3fs.S3FileSystem.assert_called_once_with(profile=None)
-
-    @staticmethod
-    def test_fs_refresh_profile(mocker):
-        s3fs = mocker.patch("gridded_etl_tools.utils.store.s3fs")
-        store = store_module.S3(mock.Mock(), "bucket")
-        store._fs = object()
-        fs = s3fs.S3FileSystem.return_value
+    @pytest.mark.parametrize(
+        "kwargs, expected_profile, pre_cache",
+        [({}, None, False), ({"refresh": True}, None, True), ({"refresh": True, "profile": "slim"}, "slim", True)],
+        ids=["default", "refresh", "refresh_profile"],
+    )
+    def test_fs(s3fs_mock, s3_store, kwargs, expected_profile, pre_cache):
+        store = s3_store
+        if pre_cache:
+            store._fs = object()
+        fs = s3fs_mock.S3FileSystem.return_value
 
-        assert store.fs(refresh=True, profile="slim") is fs
+        assert store.fs(**kwargs) is fs
+        assert store.fs() is fs  # subsequent calls return cached value
 
-        s3fs.S3FileSystem.assert_called_once_with(profile="slim")
+        s3fs_mock.S3FileSystem.assert_called_once_with(profile=expected_profile)
 
     @staticmethod
     def test_path():
-        dm = mock.Mock(key=mock.Mock(return_value="hello_mother"), custom_output_path=None)
+        dm = NS(key=lambda: "hello_mother", custom_output_path=None)
         store = store_module.S3(dm, "mop_bucket")
         assert store.path == "s3://mop_bucket/datasets/hello_mother.zarr"
 
     @staticmethod
     def test_path_customized():
-        dm = mock.Mock(key=mock.Mock(return_value="hello_mother"), custom_output_path="use/this/one/instead.zarr")
+        dm = NS(key=lambda: "hello_mother", custom_output_path="use/this/one/instead.zarr")
         store = store_module.S3(dm, "mop_bucket")
         assert store.path == "use/this/one/instead.zarr"
 
     @staticmethod
     def test___str__():
-        dm = mock.Mock(key=mock.Mock(return_value="hello_mother"), custom_output_path=None)
+        dm = NS(key=lambda: "hello_mother", custom_output_path=None)
         store = store_module.S3(dm, "mop_bucket")
         assert str(store) == "s3://mop_bucket/datasets/hello_mother.zarr"
 
     @staticmethod
-    def test_mapper(mocker):
-        s3fs = mocker.patch("gridded_etl_tools.utils.store.s3fs")
-        mapper = s3fs.S3Map.return_value
-        store = store_module.S3(mock.Mock(custom_output_path="put/it/here.zarr"), "bucket")
-        store.fs = mock.Mock()
-
-        fs = store.fs.return_value
-
-        assert store.mapper(arbitrary="keyword") is mapper
-        assert store.mapper() is mapper  # second call uses cached object
-
-        store.fs.assert_called_once_with()
-        s3fs.S3Map.assert_called_once_with(root="put/it/here.zarr", s3=fs)
-
-    @staticmethod
-    def test_mapper_refresh(mocker):
-        s3fs = mocker.patch("gridded_etl_tools.utils.store.s3fs")
-        mapper = s3fs.S3Map.return_value
-        store = store_module.S3(mock.Mock(custom_output_path="put/it/here.zarr"), "bucket")
-        store.fs = mock.Mock()
-        store._mapper = object()
+    @pytest.mark.parametrize(
+        "kwargs, pre_cache", [({"arbitrary": "keyword"}, False), ({"refresh": True}, True)], ids=["default", "refresh"]
+    )
+    def test_mapper(s3fs_mock, s3_store_with_fs, kwargs, pre_cache):
+        mapper = s3fs_mock.S3Map.return_value
+        store = s3_store_with_fs
+        if pre_cache:
+            store._mapper = object()
 
         fs = store.fs.return_value
 
-        assert store.mapper(refresh=True) is mapper
+        assert store.mapper(**kwargs) is mapper
+        assert store.mapper() is mapper  # subsequent calls use cached object
 
         store.fs.assert_called_once_with()
-        s3fs.S3Map.assert_called_once_with(root="put/it/here.zarr", s3=fs)
+        s3fs_mock.S3Map.assert_called_once_with(root="put/it/here.zarr", s3=fs)
 
     @staticmethod
-    def test_has_existing():
-        store = store_module.S3(mock.Mock(custom_output_path="it/is/here.zarr"), "bucket")
-        store.fs = mock.Mock()
+    def test_has_existing(s3_store_with_fs):
+        store = s3_store_with_fs
         fs = store.fs.return_value
 
         assert store.has_existing is fs.exists.return_value
 
         store.fs.assert_called_once_with()
-        fs.exists.assert_called_once_with("it/is/here.zarr")
+        fs.exists.assert_called_once_with("put/it/here.zarr")
 
     @staticmethod
-    def test_push_metadata_path_does_not_exist():
-        store = store_module.S3(None, "mopwater")
+    @pytest.mark.parametrize("path_exists", [False, True], ids=["path_does_not_exist", "path_exists"])
+    def test_push_metadata(s3_store_with_fs, path_exists):
+        store = s3_store_with_fs
         store.get_metadata_path = mock.Mock(return_value="path/to/meta/data")
-        store.fs = mock.Mock()
         fs = store.fs.return_value
-        fs.exists.return_value = False
-
-        store.push_metadata("War and Peace", {"meta": "data"}, "fiction")
-
-        store.fs.assert_called_once_with()
-        store.get_metadata_path.assert_called_once_with("War and Peace", "fiction")
-        fs.exists.assert_called_once_with("path/to/meta/data")
-        fs.ls.assert_not_called()
-        fs.copy.assert_not_called()
-        fs.write_text.assert_called_once_with("path/to/meta/data", '{"meta": "data"}')
-
-    @staticmethod
-    def test_push_metadata_path_exists():
-        store = store_module.S3(None, "mopwater")
-        store.get_metadata_path = mock.Mock(return_value="path/to/meta/data")
-        store.fs = mock.Mock()
-        fs = store.fs.return_value
-        fs.exists.return_value = True
+        fs.exists.return_value = path_exists
         fs.ls.return_value = [
             {"LastModified": datetime.datetime(1975, 12, 25, 6, 0, 0)},
             "NobodyCares",
@@ -210,17 +263,20 @@ class TestS3:
         store.fs.assert_called_once_with()
         store.get_metadata_path.assert_called_once_with("War and Peace", "fiction")
         fs.exists.assert_called_once_with("path/to/meta/data")
-        fs.ls.assert_called_once_with("path/to/meta/data", detail=True)
-        fs.copy.assert_called_once_with(
-            "path/to/meta/data", "s3://mopwater/history/War and Peace/War and Peace-1975-12-25T06:00:00.json"
-        )
+        if path_exists:
+            fs.ls.assert_called_once_with("path/to/meta/data", detail=True)
+            fs.copy.assert_called_once_with(
+                "path/to/meta/data", "s3://bucket/history/War and Peace/War and Peace-1975-12-25T06:00:00.json"
+            )
+        else:
+            fs.ls.assert_not_called()
+            fs.copy.assert_not_called()
         fs.write_text.assert_called_once_with("path/to/meta/data", '{"meta": "data"}')
 
     @staticmethod
-    def test_retrieve_metadata():
-        store = store_module.S3(None, "bucket")
+    def test_retrieve_metadata(s3_store_with_fs):
+        store = s3_store_with_fs
         store.get_metadata_path = mock.Mock(return_value="meta/data/goes/here")
-        store.fs = mock.Mock()
         fs = store.fs.return_value
         fs.cat.return_value = '{"meta": {"meta": "data"}}'
 
@@ -234,10 +290,9 @@ class TestS3:
         fs.cat.assert_called_once_with("meta/data/goes/here")
 
     @staticmethod
-    def test_metadata_exists():
-        store = store_module.S3(None, "bucket")
+    def test_metadata_exists(s3_store_with_fs):
+        store = s3_store_with_fs
         store.get_metadata_path = mock.Mock(return_value="meta/data/here")
-        store.fs = mock.Mock()
         fs = store.fs.return_value
 
         assert store.metadata_exists("Marquee Moon", "The Album") is fs.exists.return_value
@@ -253,26 +308,23 @@ class TestS3:
         assert store.get_metadata_path("Hammer of the Bobs", "") == "s3://sop/metadata/Hammer of the Bobs.json"
 
     @staticmethod
-    def test_write_metadata_only(tmpdir):
-        with open(tmpdir / ".zmetadata", "w") as f:
-            json.dump({"metadata": {".zattrs": {"meta": "data"}}}, f)
-        with open(tmpdir / ".zattrs", "w") as f:
-            json.dump({"attr": "ibute"}, f)
-
-        store = store_module.S3(mock.Mock(custom_output_path=tmpdir), "bucket")
-        store.fs = mock.Mock()
-        fs = store.fs.return_value
-        fs.open = open
+    def test_write_metadata_only(s3_store_with_fs):
+        store = s3_store_with_fs
+        fs = FakeFS(
+            {
+                "put/it/here.zarr/.zmetadata": json.dumps({"metadata": {".zattrs": {"meta": "data"}}}),
+                "put/it/here.zarr/.zattrs": json.dumps({"attr": "ibute"}),
+            }
+        )
+        store.fs.return_value = fs
 
         store.write_metadata_only({"new": "value"})
 
         store.fs.assert_called_once_with()
-
-        with open(tmpdir / ".zmetadata") as f:
-            assert json.load(f) == {"metadata": {".zattrs": {"meta": "data", "new": "value"}}}
-
-        with open(tmpdir / ".zattrs") as f:
-            assert json.load(f) == {"attr": "ibute", "new": "value"}
+        assert json.loads(fs["put/it/here.zarr/.zmetadata"]) == {
+            "metadata": {".zattrs": {"meta": "data", "new": "value"}}
+        }
+        assert json.loads(fs["put/it/here.zarr/.zattrs"]) == {"attr": "ibute", "new": "value"}
 
 
 class TestIPLD:
@@ -406,51 +458,44 @@ class TestIPLD:
             store.get_metadata_path("Jeremy", "Bearimy")
 
 
-class TestLocal:
-    @staticmethod
-    def test_fs(mocker):
-        fsspec = mocker.patch("gridded_etl_tools.utils.store.fsspec")
-        store = store_module.Local(mock.Mock())
-        fs = fsspec.filesystem.return_value
-
-        assert store.fs() is fs
-        assert store.fs() is fs  # second call returns cached value
-
-        fsspec.filesystem.assert_called_once_with("file")
+@pytest.fixture
+def local_store():
+    return store_module.Local(NS(custom_output_path="el/cami/no"))
 
-    @staticmethod
-    def test_fs_refresh(mocker):
-        fsspec = mocker.patch("gridded_etl_tools.utils.store.fsspec")
-        store = store_module.Local(mock.Mock())
-        store._fs = object()
-        fs = fsspec.filesystem.return_value
 
-        assert store.fs(refresh=True) is fs
+@pytest.fixture
+def local_store_with_fs(local_store, fs_chain):
+    local_store.fs = fs_chain
+    return local_store
 
-        fsspec.filesystem.assert_called_once_with("file")
 
+class TestLocal:
     @staticmethod
-    def test_mapper():
-        store = store_module.Local(mock.Mock(custom_output_path="el/cami/no"))
-        store.fs = mock.Mock()
-        fs = store.fs.return_value
-        mapper = fs.get_mapper.return_value
+    @pytest.mark.parametrize("kwargs, pre_cache", [({}, False), ({"refresh": True}, True)], ids=["default", "refresh"])
+    def test_fs(fsspec_mock, local_store, kwargs, pre_cache):
+        store = local_store
+        if pre_cache:
+            store._fs = object()
+        fs = fsspec_mock.filesystem.return_value
 
-        assert store.mapper(arbitrary="keyword") is mapper
-        assert store.mapper() is mapper  # Second call returns cached copy
+        assert store.fs(**kwargs) is fs
+        assert store.fs() is fs  # subsequent calls return cached value
 
-        store.fs.assert_called_once_with()
-        fs.get_mapper.assert_called_once_with("el/cami/no")
+        fsspec_mock.filesystem.assert_called_once_with("file")
 
     @staticmethod
-    def test_mapper_refresh():
-        store = store_module.Local(mock.Mock(custom_output_path="el/cami/no"))
-        store.fs = mock.Mock()
+    @pytest.mark.parametrize(
+        "kwargs, pre_cache", [({"arbitrary": "keyword"}, False), ({"refresh": True}, True)], ids=["default", "refresh"]
+    )
+    def test_mapper(local_store_with_fs, kwargs, pre_cache):
+        store = local_store_with_fs
         fs = store.fs.return_value
         mapper = fs.get_mapper.return_value
-        store._mapper = object()
+        if pre_cache:
+            store._mapper = object()
 
-        assert store.mapper(refresh=True) is mapper
+        assert store.mapper(**kwargs) is mapper
+        assert store.mapper() is mapper  # subsequent calls return cached copy
 
         store.fs.assert_called_once_with()
         fs.get_mapper.assert_called_once_with("el/cami/no")
@@ -489,62 +534,72 @@ class TestLocal:
 
     @staticmethod
     def test_has_existing():
-        store = store_module.Local(mock.Mock())
-        path = store.dm.custom_output_path
+        path = mock.Mock()
+        store = store_module.Local(NS(custom_output_path=path))
 
         assert store.has_existing is path.exists.return_value
 
         path.exists.assert_called_once_with()
 
     @staticmethod
-    def test_push_metadata(tmpdir):
-        metadata_path = tmpdir / "ztest.json"
-        store = store_module.Local(mock.Mock())
-        store.get_metadata_path = mock.Mock(return_value=metadata_path)
-        store.push_metadata("Jacky", {"meta": "data"}, "song")
+    def test_push_metadata(local_store_with_fs):
+        store = local_store_with_fs
+        fs = FakeFS()
+        store.fs.return_value = fs
+        store.get_metadata_path = mock.Mock(return_value="/hi/mom/metadata/song/Jacky.json")
 
-        with open(metadata_path) as f:
-            assert json.load(f) == {"meta": "data"}
+        store.push_metadata("Jacky", {"meta": "data"}, "song")
 
+        assert fs == {"/hi/mom/metadata/song/Jacky.json": '{"meta": "data"}'}
         store.get_metadata_path.assert_called_once_with("Jacky", "song")
 
     @staticmethod
-    def test_push_metadata_overwrite(tmpdir):
-        metadata_path = tmpdir / "ztest.json"
-        with open(metadata_path, "w") as f:
-            json.dump({"prev": "data"}, f)
-        os.utime(metadata_path, (1692639017, 1692639017))  # 2023-08-21T13:30:17
-
-        store = store_module.Local(mock.Mock(), tmpdir)
-        store.get_metadata_path = mock.Mock(return_value=metadata_path)
+    def test_push_metadata_overwrite(mocker, local_store_with_fs):
+        datetime_mock = mocker.patch.object(store_module, "datetime")
+        datetime_mock.datetime.fromtimestamp.return_value = datetime.datetime(2023, 8, 21, 17, 30, 17)
+        store = local_store_with_fs
+        store.folder = "/hi/mom"
+        fs = FakeFS({"/hi/mom/metadata/song/Jacky.json": '{"prev": "data"}'})
+        store.fs.return_value = fs
+        store.get_metadata_path = mock.Mock(return_value="/hi/mom/metadata/song/Jacky.json")
 
         store.push_metadata("Jacky", {"meta": "data"}, "song")
 
-        with open(metadata_path) as f:
-            assert json.load(f) == {"meta": "data"}
+        assert json.loads(fs["/hi/mom/metadata/song/Jacky.json"]) == {"meta": "data"}
+        assert json.loads(fs["/hi/mom/history/Jacky/Jacky-2023-08-21T17:30:17.json"]) == {"prev": "data"}
+        datetime_mock.datetime.fromtimestamp.assert_called_once_with(FakeFS.mtime, tz=datetime_mock.timezone.utc)
+        store.get_metadata_path.assert_called_once_with("Jacky", "song")
+
+    @staticmethod
+    def test_push_metadata_overwrite_local_filesystem(tmp_path):
+        store = store_module.Local(None, tmp_path)
+        store.push_metadata("Jacky", {"prev": "data"}, "song")
+        metadata_path = pathlib.Path(store.get_metadata_path("Jacky", "song"))
+        os.utime(metadata_path, (1692639017, 1692639017))  # 2023-08-21T17:30:17Z
 
-        with open(tmpdir / "history" / "Jacky" / "Jacky-2023-08-21T17:30:17.json") as f:
-            assert json.load(f) == {"prev": "data"}
+        store.push_metadata("Jacky", {"meta": "data"}, "song")
 
-        store.get_metadata_path.assert_called_once_with("Jacky", "song")
+        assert json.loads(metadata_path.read_text()) == {"meta": "data"}
+        history_path = tmp_path / "history" / "Jacky" / "Jacky-2023-08-21T17:30:17.json"
+        assert json.loads(history_path.read_text()) == {"prev": "data"}
 
     @staticmethod
-    def test_retrieve_metadata(tmpdir):
-        metadata_path = tmpdir / "ztest.json"
+    def test_retrieve_metadata(tmp_path):
+        metadata_path = tmp_path / "ztest.json"
         with open(metadata_path, "w") as f:
             json.dump({"meta": "data"}, f)
 
-        store = store_module.Local(mock.Mock())
+        store = store_module.Local(None)
         store.get_metadata_path = mock.Mock(return_value=metadata_path)
 
-        assert store.retrieve_metadata("Jacky", "song") == ({"meta": "data"}, metadata_path)
+        assert store.retrieve_metadata("Jacky", "song") == ({"meta": "data"}, str(metadata_path))
         store.get_metadata_path.assert_called_once_with("Jacky", "song")
 
     @staticmethod
-    def test_metadata_exists_false(tmpdir):
-        metadata_path = tmpdir / "ztest.json"
+    def test_metadata_exists_false(tmp_path):
+        metadata_path = tmp_path / "ztest.json"
 
-        store = store_module.Local(mock.Mock())
+        store = store_module.Local(None)
         store.get_metadata_path = mock.Mock(return_value=metadata_path)
 
         assert store.metadata_exists("Jacky", "song") is False
@@ -556,17 +611,33 @@ class TestLocal:
         assert store.get_metadata_path("A Separate Peace", "novel") == "/hi/mom/metadata/novel/A Separate Peace.json"
 
     @staticmethod
-    def test_write_metadata_only(tmpdir):
-        with open(tmpdir / ".zmetadata", "w") as f:
-            json.dump({"metadata": {".zattrs": {"meta": "data"}}}, f)
-        with open(tmpdir / ".zattrs", "w") as f:
-            json.dump({"attr": "ibute"}, f)
+    def test_write_metadata_only(local_store_with_fs):
+        store = local_store_with_fs
+        fs = FakeFS(
+            {
+                "el/cami/no/.zmetadata": json.dumps({"metadata": {".zattrs": {"meta": "data"}}}),
+                "el/cami/no/.zattrs": json.dumps({"attr": "ibute"}),
+            }
+        )
+        store.fs.return_value = fs
 
-        store = store_module.Local(mock.Mock(custom_output_path=tmpdir))
         store.write_metadata_only({"new": "value"})
 
-        with open(tmpdir / ".zmetadata") as f:
-            assert json.load(f) == {"metadata": {".zattrs": {"meta": "data", "new": "value"}}}
+        store.fs.assert_called_once_with()
+        assert json.loads(fs["el/cami/no/.zmetadata"]) == {"metadata": {".zattrs": {"meta": "data", "new": "value"}}}
+        assert json.loads(fs["el/cami/no/.zattrs"]) == {"attr": "ibute", "new": "value"}
+
+    @staticmethod
+    def test_write_metadata_only_local_filesystem(tmp_path):
+        zarr_path = tmp_path / "el.zarr"
+        zarr_path.mkdir()
+        (zarr_path / ".zmetadata").write_text(json.dumps({"metadata": {".zattrs": {"meta": "data"}}}))
+        (zarr_path / ".zattrs").write_text(json.dumps({"attr": "ibute"}))
+        store = store_module.Local(NS(custom_output_path=zarr_path))
+
+        store.write_metadata_only({"new": "value"})
 
-        with open(tmpdir / ".zattrs") as f:
-            assert json.load(f) == {"attr": "ibute", "new": "value"}
+        assert json.loads((zarr_path / ".zmetadata").read_text()) == {
+            "metadata": {".zattrs": {"meta": "data", "new": "value"}}
+        }
+        assert json.loads((zarr_path / ".zattrs").read_text()) == {"attr": "ibute", "new": "value"}
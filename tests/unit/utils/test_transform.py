@@ -37,6 +37,14 @@ def input_files(tmp_path, mocker):
     return files
 
 
+@pytest.fixture
+def key_dims_manager(base_manager, mocker):
+    """The shared manager, with the attributes `set_key_dims` writes to restored after each test"""
+    mocker.patch.object(base_manager, "standard_dims", base_manager.standard_dims)
+    mocker.patch.object(base_manager, "time_dim", base_manager.time_dim)
+    return base_manager
+
+
 class TestTransform:
     @staticmethod
     def test_create_zarr_json(manager_class, tmp_path, mocker, input_files):
@@ -422,60 +430,54 @@ class TestTransform:
         )
 
     @staticmethod
-    def test_export_zarr_json_in_memory_to_file(manager_class, tmpdir):
-        dm = manager_class()
-        local_file_path = tmpdir / "output_zarr_json.json"
+    def test_export_zarr_json_in_memory_to_file(base_manager, tmp_path):
+        local_file_path = tmp_path / "output_zarr_json.json"
         json_data = {"hi": "mom!"}
-        dm.zarr_json_in_memory_to_file(json_data, local_file_path=local_file_path)
+        base_manager.zarr_json_in_memory_to_file(json_data, local_file_path=local_file_path)
         with open(local_file_path) as f:
             assert json.load(f) == json_data
 
     @staticmethod
-    def test_export_zarr_json_in_memory_to_file_override_local_path(manager_class, tmpdir):
+    def test_export_zarr_json_in_memory_to_file_override_local_path(manager_class, tmp_path):
         json_data = {"hi": "mom!"}
-        local_file_path = tmpdir / "output_zarr_json.json"
+        local_file_path = tmp_path / "output_zarr_json.json"
 
         def file_path_from_zarr_json_attrs(scanned_zarr_json, local_file_path):
             assert scanned_zarr_json == json_data
             assert local_file_path == local_file_path
 
-            return tmpdir / "this_other_zarr.json"
+            return tmp_path / "this_other_zarr.json"
 
         dm = manager_class()
         dm.file_path_from_zarr_json_attrs = file_path_from_zarr_json_attrs
 
         dm.zarr_json_in_memory_to_file(json_data, local_file_path=local_file_path)
         assert not os.path.exists(local_file_path)
-        with open(tmpdir / "this_other_zarr.json") as f:
+        with open(tmp_path / "this_other_zarr.json") as f:
             assert json.load(f) == json_data
 
     @staticmethod
-    def test_preprocess_kerchunk(manager_class, example_zarr_json):
+    def test_preprocess_kerchunk(base_manager, example_zarr_json, example_orig_fill_value, mocker):
         """
         Test that the preprocess_kerchunk method successfully changes the _FillValue attribute of all arrays
         """
-        orig_fill_value = json.loads(example_zarr_json["refs"]["latitude/.zarray"])["fill_value"]
-
-        # prepare a dataset manager and preprocess a Zarr JSON
-        class MyManagerClass(manager_class):
-            missing_value = -8888
+        # preprocess a Zarr JSON with a patched missing value. `preprocess_kerchunk` is a class method, so the
+        # patch goes on the class.
+        mocker.patch.object(type(base_manager), "missing_value", -8888)
 
-        dm = MyManagerClass()
+        pp_zarr_json = base_manager.preprocess_kerchunk(example_zarr_json["refs"])
 
-        pp_zarr_json = dm.preprocess_kerchunk(example_zarr_json["refs"])
-
-        # populate before/after fill value variables
+        # populate the after fill value variable
         modified_fill_value = int(json.loads(pp_zarr_json["latitude/.zarray"])["fill_value"])
 
         # test that None != -8888
-        assert orig_fill_value != modified_fill_value
+        assert example_orig_fill_value != modified_fill_value
         assert modified_fill_value == -8888
 
     @staticmethod
-    def test_postprocess_kerchunk(manager_class):
-        dm = manager_class()
+    def test_postprocess_kerchunk(base_manager):
         out_zarr = object()
-        assert dm.postprocess_kerchunk(out_zarr) is out_zarr
+        assert base_manager.postprocess_kerchunk(out_zarr) is out_zarr
 
     @staticmethod
     def test_parallel_subprocess_files(mocker, manager_class):
@@ -915,29 +917,27 @@ class TestTransform:
         )
 
     @staticmethod
-    def test_preprocess_zarr(manager_class):
-        dm = manager_class()
+    def test_preprocess_zarr(base_manager):
         dataset = object()
-        assert dm.preprocess_zarr(dataset) is dataset
+        assert base_manager.preprocess_zarr(dataset) is dataset
 
     @staticmethod
-    def test_postprocess_zarr(manager_class):
-        dm = manager_class()
+    def test_postprocess_zarr(base_manager):
         dataset = object()
-        assert dm.postprocess_zarr(dataset) is dataset
+        assert base_manager.postprocess_zarr(dataset) is dataset
 
     @staticmethod
-    def test_set_key_dims(manager_class):
-        dm = manager_class()
+    def test_set_key_dims(key_dims_manager):
+        dm = key_dims_manager
 
         dm.set_key_dims()
         assert dm.standard_dims == ["time", "latitude", "longitude"]
         assert dm.time_dim == "time"
 
     @staticmethod
-    def test_set_key_dims_hindcast(manager_class):
-        dm = manager_class()
-        dm.dataset_category = "hindcast"
+    def test_set_key_dims_hindcast(key_dims_manager, mocker):
+        dm = key_dims_manager
+        mocker.patch.object(dm, "dataset_category", "hindcast")
 
         dm.set_key_dims()
         assert dm.standard_dims == [
@@ -951,9 +951,9 @@ class TestTransform:
         assert dm.time_dim == "hindcast_reference_time"
 
     @staticmethod
-    def test_set_key_dims_ensemble(manager_class):
-        dm = manager_class()
-        dm.dataset_category = "ensemble"
+    def test_set_key_dims_ensemble(key_dims_manager, mocker):
+        dm = key_dims_manager
+        mocker.patch.object(dm, "dataset_category", "ensemble")
 
         dm.set_key_dims()
         assert dm.standard_dims == [
@@ -966,9 +966,9 @@ class TestTransform:
         assert dm.time_dim == "forecast_reference_time"
 
     @staticmethod
-    def test_set_key_dims_forecast(manager_class):
-        dm = manager_class()
-        dm.dataset_category = "forecast"
+    def test_set_key_dims_forecast(key_dims_manager, mocker):
+        dm = key_dims_manager
+        mocker.patch.object(dm, "dataset_category", "forecast")
 
         dm.set_key_dims()
         assert dm.standard_dims == [
@@ -980,9 +980,9 @@ class TestTransform:
         assert dm.time_dim == "forecast_reference_time"
 
     @staticmethod
-    def test_set_key_dims_misspecified(manager_class):
-        dm = manager_class()
-        dm.dataset_category = "nocast"
+    def test_set_key_dims_misspecified(key_dims_manager, mocker):
+        dm = key_dims_manager
+        mocker.patch.object(dm, "dataset_category", "nocast")
 
         with pytest.raises(ValueError):
             dm.set_key_dims()